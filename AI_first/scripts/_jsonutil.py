@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""JSON encode/decode helpers that use orjson when available, stdlib json otherwise."""
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on local environment
+    orjson = None
+
+
+def json_dumps(payload: Any, *, indent2: bool = False, sort_keys: bool = False) -> bytes:
+    if orjson is not None:
+        option = 0
+        if indent2:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(payload, option=option)
+    return json.dumps(payload, indent=2 if indent2 else None, sort_keys=sort_keys).encode("utf-8")
+
+
+def json_loads(data: Any) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -2,22 +2,32 @@
 from __future__ import annotations
 
 import argparse
-import json
+import copy
+import hashlib
+import mmap
+import os
+import queue
+import shutil
 import subprocess
 import sys
 import threading
 import time
+import multiprocessing
 import uuid
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import asdict, dataclass
+from itertools import islice
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional, Tuple
 from urllib.parse import parse_qs, urlparse
 
 SCRIPTS_DIR = Path(__file__).resolve().parent
 if str(SCRIPTS_DIR) not in sys.path:
     sys.path.insert(0, str(SCRIPTS_DIR))
 
+from _jsonutil import json_dumps, json_loads
 from reintegration_lib import run_reintegration
 
 ROOT = Path(__file__).resolve().parents[2]
@@ -35,78 +45,139 @@ def _now() -> str:
     return time.strftime("%Y-%m-%dT%H:%M:%S")
 
 
+def _now_pair() -> Tuple[str, str]:
+    """Return (date, timestamp) from a single localtime() call."""
+    now = time.localtime()
+    return time.strftime("%Y-%m-%d", now), time.strftime("%Y-%m-%dT%H:%M:%S", now)
+
+
+_LOCAL_ORIGIN_PREFIXES = (
+    "http://localhost",
+    "http://127.0.0.1",
+    "http://[::1]",
+    "http://[::]",
+)
+
+
 def _is_local_origin(origin: Optional[str]) -> bool:
-    if not origin:
-        return True
-    return (
-        origin.startswith("http://localhost")
-        or origin.startswith("http://127.0.0.1")
-        or origin.startswith("http://[::1]")
-        or origin.startswith("http://[::]")
-    )
+    return not origin or origin.startswith(_LOCAL_ORIGIN_PREFIXES)
 
 
 def _tail_lines(path: Path, limit: int = 20) -> str:
     try:
-        lines = path.read_text(encoding="utf-8", errors="replace").splitlines()
-        return "\n".join(lines[-limit:])
+        with path.open("rb") as fh:
+            try:
+                mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                return ""
+            with mm:
+                end = len(mm)
+                if mm[end - 1] == 0x0A:
+                    end -= 1
+                start = end
+                for _ in range(limit):
+                    found = mm.rfind(b"\n", 0, start)
+                    if found < 0:
+                        start = 0
+                        break
+                    start = found
+                else:
+                    start += 1
+                return mm[start:end].decode("utf-8", "replace")
     except Exception:
         return ""
 
 
+# Formatted mtimes keyed by path, valid while st_mtime_ns is unchanged.
+_MTIME_CACHE: Dict[Path, Tuple[int, str]] = {}
+
+
 def _iso_mtime(path: Path) -> Optional[str]:
-    if not path.exists():
+    try:
+        st = path.stat()
+    except OSError:
         return None
-    return time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(path.stat().st_mtime))
+    cached = _MTIME_CACHE.get(path)
+    if cached is not None and cached[0] == st.st_mtime_ns:
+        return cached[1]
+    stamp = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(st.st_mtime))
+    _MTIME_CACHE[path] = (st.st_mtime_ns, stamp)
+    return stamp
+
+
+# Parsed JSON keyed by path, valid while st_mtime_ns is unchanged.
+_JSON_CACHE: Dict[Path, Tuple[int, Dict[str, Any]]] = {}
+_JSON_CACHE_LOCK = threading.Lock()
+
+# Parent directories already created; saves a mkdir (stat) per JSON write.
+_ENSURED_DIRS: set = set()
 
 
 def _write_json(path: Path, payload: Dict[str, Any]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.parent not in _ENSURED_DIRS:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(path.parent)
     tmp = path.with_suffix(path.suffix + ".tmp")
-    tmp.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+    tmp.write_bytes(json_dumps(payload, indent2=True, sort_keys=True))
     tmp.replace(path)
+    with _JSON_CACHE_LOCK:
+        _JSON_CACHE.pop(path, None)
 
 
 def _read_json(path: Path, default: Dict[str, Any]) -> Dict[str, Any]:
-    if not path.exists():
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
         _write_json(path, default)
         return default
+    with _JSON_CACHE_LOCK:
+        cached = _JSON_CACHE.get(path)
+        if cached is not None and cached[0] == mtime_ns:
+            return copy.deepcopy(cached[1])
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        payload = json_loads(path.read_bytes())
     except Exception:
         _write_json(path, default)
         return default
+    with _JSON_CACHE_LOCK:
+        _JSON_CACHE[path] = (mtime_ns, payload)
+    return copy.deepcopy(payload)
 
 
-def _default_quick_issues() -> Dict[str, Any]:
-    return {"updated_at": time.strftime("%Y-%m-%d"), "issues": []}
+def _default_quick_issues(now_date: Optional[str] = None) -> Dict[str, Any]:
+    return {"updated_at": now_date or time.strftime("%Y-%m-%d"), "issues": [], "counters": {}}
 
 
-def _default_simple_project() -> Dict[str, Any]:
+def _default_simple_project(now_date: Optional[str] = None) -> Dict[str, Any]:
     return {
         "title": "Untitled project",
         "summary": "Describe the current focus, scope, and key decisions here.",
-        "updated_at": time.strftime("%Y-%m-%d"),
+        "updated_at": now_date or time.strftime("%Y-%m-%d"),
         "entries": [],
     }
 
 
-def _default_ui_style_selection() -> Dict[str, Any]:
-    return {"active_template_id": "", "notes": "", "updated_at": time.strftime("%Y-%m-%d")}
+def _default_ui_style_selection(now_date: Optional[str] = None) -> Dict[str, Any]:
+    return {"active_template_id": "", "notes": "", "updated_at": now_date or time.strftime("%Y-%m-%d")}
 
 
-def _next_issue_id(issues: List[Dict[str, Any]], now_date: str) -> str:
+def _next_issue_id(data: Dict[str, Any], now_date: str) -> str:
     prefix = f"QI-{now_date[:4]}-{now_date[5:7]}-"
-    numbers: List[int] = []
-    for issue in issues:
-        issue_id = str(issue.get("id") or "")
-        if not issue_id.startswith(prefix):
-            continue
-        tail = issue_id.rsplit("-", 1)[-1]
-        if tail.isdigit():
-            numbers.append(int(tail))
-    next_num = (max(numbers) if numbers else 0) + 1
-    return f"{prefix}{next_num:03d}"
+    counters = data.setdefault("counters", {})
+    if prefix not in counters:
+        # Migrate older files once by scanning existing IDs; afterwards the
+        # persisted counter makes ID assignment O(1).
+        numbers: List[int] = []
+        for issue in data.get("issues") or []:
+            issue_id = str(issue.get("id") or "")
+            if not issue_id.startswith(prefix):
+                continue
+            tail = issue_id.rsplit("-", 1)[-1]
+            if tail.isdigit():
+                numbers.append(int(tail))
+        counters[prefix] = max(numbers) if numbers else 0
+    counters[prefix] += 1
+    return f"{prefix}{counters[prefix]:03d}"
 
 
 def _normalize_status(value: Optional[str]) -> str:
@@ -148,9 +219,27 @@ def _render_simple_project_md(payload: Dict[str, Any]) -> str:
     return "\n".join(lines) + "\n"
 
 
+# Digest of the markdown last written (or found on disk); lets no-op edits
+# skip the filesystem write entirely.
+_SIMPLE_PROJECT_MD_DIGEST: Optional[bytes] = None
+
+
 def _write_simple_project_md(payload: Dict[str, Any]) -> None:
+    global _SIMPLE_PROJECT_MD_DIGEST
+    rendered = _render_simple_project_md(payload).encode("utf-8")
+    digest = hashlib.blake2b(rendered).digest()
+    if digest == _SIMPLE_PROJECT_MD_DIGEST:
+        return
+    if _SIMPLE_PROJECT_MD_DIGEST is None:
+        try:
+            if SIMPLE_PROJECT_MD_PATH.read_bytes() == rendered:
+                _SIMPLE_PROJECT_MD_DIGEST = digest
+                return
+        except OSError:
+            pass
     SIMPLE_PROJECT_MD_PATH.parent.mkdir(parents=True, exist_ok=True)
-    SIMPLE_PROJECT_MD_PATH.write_text(_render_simple_project_md(payload), encoding="utf-8")
+    SIMPLE_PROJECT_MD_PATH.write_bytes(rendered)
+    _SIMPLE_PROJECT_MD_DIGEST = digest
 
 
 @dataclass(frozen=True)
@@ -158,7 +247,8 @@ class ActionSpec:
     id: str
     label: str
     description: str
-    commands: List[List[str]]
+    commands: Tuple[Tuple[str, ...], ...]
+    command_strs: Tuple[str, ...]
     fallback_cmd: str
 
 
@@ -174,113 +264,166 @@ class Job:
     returncode: Optional[int] = None
 
 
+def _spec(
+    id: str, label: str, description: str, commands: Tuple[Tuple[str, ...], ...], fallback_cmd: str
+) -> ActionSpec:
+    return ActionSpec(
+        id=id,
+        label=label,
+        description=description,
+        commands=commands,
+        command_strs=tuple(" ".join(cmd) for cmd in commands),
+        fallback_cmd=fallback_cmd,
+    )
+
+
 def _action_specs(python_bin: str) -> Dict[str, ActionSpec]:
+    render_docs = (python_bin, "AI_first/scripts/render_docs.py")
+    render_pm = (python_bin, "AI_first/scripts/render_pm.py")
+    bugmgmt_json = (
+        python_bin,
+        "AI_first/scripts/issues.py",
+        "list",
+        "--format",
+        "json",
+        "--output",
+        "AI_first/bugmgmt/exports/json/bugmgmt_issues.json",
+    )
+    bugmgmt_html = (
+        python_bin,
+        "AI_first/scripts/issues.py",
+        "list",
+        "--format",
+        "html",
+        "--output",
+        "AI_first/ui/bugmgmt_issues.html",
+    )
+    bugmgmt_fallback = (
+        "python3 AI_first/scripts/issues.py list --format json --output "
+        "AI_first/bugmgmt/exports/json/bugmgmt_issues.json && "
+        "python3 AI_first/scripts/issues.py list --format html --output "
+        "AI_first/ui/bugmgmt_issues.html"
+    )
     return {
-        "render_docs": ActionSpec(
+        "render_docs": _spec(
             id="render_docs",
             label="Render docs",
             description="Refresh AI_first/ui/docs from markdown.",
-            commands=[[python_bin, "AI_first/scripts/render_docs.py"]],
+            commands=(render_docs,),
             fallback_cmd="python3 AI_first/scripts/render_docs.py",
         ),
-        "render_pm": ActionSpec(
+        "render_pm": _spec(
             id="render_pm",
             label="Render PM report",
             description="Refresh AI_first/ui/PM.html and project detail pages.",
-            commands=[[python_bin, "AI_first/scripts/render_pm.py"]],
+            commands=(render_pm,),
             fallback_cmd="python3 AI_first/scripts/render_pm.py",
         ),
-        "bugmgmt_export": ActionSpec(
+        "bugmgmt_export": _spec(
             id="bugmgmt_export",
             label="Export BugMgmt",
             description="Regenerate BugMgmt JSON + HTML exports.",
-            commands=[
-                [
-                    python_bin,
-                    "AI_first/scripts/issues.py",
-                    "list",
-                    "--format",
-                    "json",
-                    "--output",
-                    "AI_first/bugmgmt/exports/json/bugmgmt_issues.json",
-                ],
-                [
-                    python_bin,
-                    "AI_first/scripts/issues.py",
-                    "list",
-                    "--format",
-                    "html",
-                    "--output",
-                    "AI_first/ui/bugmgmt_issues.html",
-                ],
-            ],
-            fallback_cmd=(
-                "python3 AI_first/scripts/issues.py list --format json --output "
-                "AI_first/bugmgmt/exports/json/bugmgmt_issues.json && "
-                "python3 AI_first/scripts/issues.py list --format html --output "
-                "AI_first/ui/bugmgmt_issues.html"
-            ),
+            commands=(bugmgmt_json, bugmgmt_html),
+            fallback_cmd=bugmgmt_fallback,
         ),
-        "refresh_all": ActionSpec(
+        "refresh_all": _spec(
             id="refresh_all",
             label="Refresh all",
             description="Render docs + PM report + BugMgmt exports.",
-            commands=[
-                [python_bin, "AI_first/scripts/render_docs.py"],
-                [python_bin, "AI_first/scripts/render_pm.py"],
-                [
-                    python_bin,
-                    "AI_first/scripts/issues.py",
-                    "list",
-                    "--format",
-                    "json",
-                    "--output",
-                    "AI_first/bugmgmt/exports/json/bugmgmt_issues.json",
-                ],
-                [
-                    python_bin,
-                    "AI_first/scripts/issues.py",
-                    "list",
-                    "--format",
-                    "html",
-                    "--output",
-                    "AI_first/ui/bugmgmt_issues.html",
-                ],
-            ],
+            commands=(render_docs, render_pm, bugmgmt_json, bugmgmt_html),
             fallback_cmd=(
                 "python3 AI_first/scripts/render_docs.py && "
-                "python3 AI_first/scripts/render_pm.py && "
-                "python3 AI_first/scripts/issues.py list --format json --output "
-                "AI_first/bugmgmt/exports/json/bugmgmt_issues.json && "
-                "python3 AI_first/scripts/issues.py list --format html --output "
-                "AI_first/ui/bugmgmt_issues.html"
+                "python3 AI_first/scripts/render_pm.py && " + bugmgmt_fallback
             ),
         ),
     }
 
 
+# Scripts that expose run(argv); their commands execute in the warm worker
+# pool instead of paying a fresh interpreter start (imports, site.py) per job.
+_POOL_MODULES = {"render_docs", "render_pm", "issues"}
+
+
+def _pool_init() -> None:
+    import importlib
+
+    os.chdir(str(ROOT))
+    if str(SCRIPTS_DIR) not in sys.path:
+        sys.path.insert(0, str(SCRIPTS_DIR))
+    for name in _POOL_MODULES:
+        importlib.import_module(name)
+
+
+def _run_pooled_command(argv: List[str]) -> Tuple[int, str]:
+    import importlib
+    import io
+    import traceback
+    from contextlib import redirect_stderr, redirect_stdout
+
+    module = importlib.import_module(Path(argv[1]).stem)
+    buf = io.StringIO()
+    try:
+        with redirect_stdout(buf), redirect_stderr(buf):
+            returncode = int(module.run(argv[2:]) or 0)
+    except SystemExit as exc:
+        returncode = exc.code if isinstance(exc.code, int) else (0 if exc.code is None else 1)
+    except Exception:
+        buf.write(traceback.format_exc())
+        returncode = 1
+    return returncode, buf.getvalue()
+
+
 class ControlServer:
     def __init__(self, cfg: argparse.Namespace) -> None:
         self.cfg = cfg
         self.jobs: Dict[str, Job] = {}
         self.job_order: List[str] = []
         self.lock = threading.Lock()
-        self.queue: List[str] = []
-        self.queue_running = False
-        self.error_log: List[Dict[str, Any]] = []
+        self.queue: queue.Queue[str] = queue.Queue()
+        self.error_log: Deque[Dict[str, Any]] = deque(maxlen=200)
         self.actions = _action_specs(cfg.python)
+        self.log_root = Path(cfg.log_dir).expanduser().resolve()
+        # Static per server lifetime; build once instead of per status poll.
+        self.api_base = f"http://{cfg.host}:{cfg.port}"
+        self.actions_payload = [
+            {
+                "id": spec.id,
+                "label": spec.label,
+                "description": spec.description,
+                "fallback_cmd": spec.fallback_cmd,
+            }
+            for spec in self.actions.values()
+        ]
+        self.status_static = {
+            "ok": True,
+            "repo_root": str(ROOT),
+            "api_base": self.api_base,
+            "actions": self.actions_payload,
+        }
+        self.pool = self._new_pool()
+        # One persistent worker; Queue.get blocks until a job arrives.
+        threading.Thread(target=self._queue_worker, daemon=True).start()
+
+    @staticmethod
+    def _new_pool() -> ProcessPoolExecutor:
+        # spawn is fork-safe alongside the server's threads; the worker stays
+        # resident so script imports are paid once, not per job.
+        return ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_pool_init,
+        )
 
     def _job_log_path(self, job_id: str, action: str) -> Path:
-        log_dir = Path(self.cfg.log_dir).expanduser()
-        log_dir.mkdir(parents=True, exist_ok=True)
+        self.log_root.mkdir(parents=True, exist_ok=True)
         safe_id = f"{job_id}_{action}".replace("/", "_")
-        return log_dir / f"{safe_id}.log"
+        return self.log_root / f"{safe_id}.log"
 
-    def _command_for(self, action: str) -> List[List[str]]:
+    def _spec_for(self, action: str) -> ActionSpec:
         spec = self.actions.get(action)
         if not spec:
             raise ValueError(f"Unsupported action {action}")
-        return spec.commands
+        return spec
 
     def status_payload(self) -> Dict[str, Any]:
         outputs = {
@@ -299,12 +442,10 @@ class ControlServer:
                 for j in self.jobs.values()
                 if j.status in {"queued", "running"}
             ]
-            error_jobs = list(self.error_log)[-50:][::-1]
+            error_jobs = list(islice(reversed(self.error_log), 50))
         return {
-            "ok": True,
+            **self.status_static,
             "server_time": _now(),
-            "repo_root": str(ROOT),
-            "api_base": f"http://{self.cfg.host}:{self.cfg.port}",
             "outputs": outputs,
             "quick_issues": {
                 "count": len(quick_issues.get("issues") or []),
@@ -316,15 +457,6 @@ class ControlServer:
             },
             "ui_style": ui_style,
             "reintegration": reintegration,
-            "actions": [
-                {
-                    "id": spec.id,
-                    "label": spec.label,
-                    "description": spec.description,
-                    "fallback_cmd": spec.fallback_cmd,
-                }
-                for spec in self.actions.values()
-            ],
             "jobs": jobs,
             "active_jobs": active_jobs,
             "error_jobs": error_jobs,
@@ -333,7 +465,7 @@ class ControlServer:
     def start_job(self, action: str) -> Job:
         job_id = uuid.uuid4().hex[:10]
         log_path = self._job_log_path(job_id, action)
-        log_url = f"http://{self.cfg.host}:{self.cfg.port}/logs/{log_path.name}"
+        log_url = f"{self.api_base}/logs/{log_path.name}"
         job = Job(
             id=job_id,
             action=action,
@@ -344,22 +476,13 @@ class ControlServer:
         with self.lock:
             self.jobs[job_id] = job
             self.job_order.append(job_id)
-            self.queue.append(job_id)
-            should_start = not self.queue_running
-            if should_start:
-                self.queue_running = True
-        if should_start:
-            thread = threading.Thread(target=self._queue_worker, daemon=True)
-            thread.start()
+        self.queue.put(job_id)
         return job
 
     def _queue_worker(self) -> None:
         while True:
+            job_id = self.queue.get()
             with self.lock:
-                if not self.queue:
-                    self.queue_running = False
-                    return
-                job_id = self.queue.pop(0)
                 job = self.jobs.get(job_id)
             if job is None:
                 continue
@@ -368,22 +491,38 @@ class ControlServer:
     def _run_job(self, job: Job) -> None:
         job.status = "running"
         job.started_at = _now()
-        commands = self._command_for(job.action)
+        spec = self._spec_for(job.action)
         log_path = Path(job.log_path)
         log_path.parent.mkdir(parents=True, exist_ok=True)
         returncode = 0
-        with log_path.open("w", encoding="utf-8") as fh:
-            for cmd in commands:
-                fh.write(f"[{_now()}] RUN: {' '.join(cmd)}\n")
+        # Binary with a 64 KiB buffer: subprocesses write raw bytes through the
+        # inherited fd, and the larger buffer amortizes syscalls for our own lines.
+        with log_path.open("wb", buffering=65536) as fh:
+            for cmd, cmd_str in zip(spec.commands, spec.command_strs):
+                fh.write(f"[{_now()}] RUN: {cmd_str}\n".encode("utf-8"))
                 fh.flush()
-                proc = subprocess.Popen(
-                    cmd,
-                    cwd=str(ROOT),
-                    stdout=fh,
-                    stderr=subprocess.STDOUT,
-                    text=True,
-                )
-                returncode = proc.wait()
+                returncode = None
+                if len(cmd) >= 2 and Path(cmd[1]).stem in _POOL_MODULES:
+                    try:
+                        returncode, output = self.pool.submit(
+                            _run_pooled_command, list(cmd)
+                        ).result()
+                        if output:
+                            fh.write(output.encode("utf-8", "replace"))
+                            fh.flush()
+                    except Exception:
+                        # Broken pool (e.g. killed worker): replace it and fall
+                        # back to a one-off subprocess for this command.
+                        returncode = None
+                        self.pool = self._new_pool()
+                if returncode is None:
+                    proc = subprocess.Popen(
+                        cmd,
+                        cwd=str(ROOT),
+                        stdout=fh,
+                        stderr=subprocess.STDOUT,
+                    )
+                    returncode = proc.wait()
                 if returncode != 0:
                     break
         job.returncode = returncode
@@ -402,8 +541,6 @@ class ControlServer:
                         "log_url": job.log_url,
                     }
                 )
-                if len(self.error_log) > 200:
-                    self.error_log = self.error_log[-200:]
 
     def get_job(self, job_id: str) -> Optional[Job]:
         with self.lock:
@@ -423,7 +560,7 @@ def parse_args() -> argparse.Namespace:
 def make_handler(server: ControlServer):
     class Handler(BaseHTTPRequestHandler):
         def _send_json(self, status: int, payload: Dict[str, Any]) -> None:
-            body = json.dumps(payload).encode("utf-8")
+            body = json_dumps(payload)
             self.send_response(status)
             self.send_header("Content-Type", "application/json; charset=utf-8")
             self.send_header("Content-Length", str(len(body)))
@@ -442,6 +579,25 @@ def make_handler(server: ControlServer):
             self.end_headers()
             self.wfile.write(data)
 
+        def _send_file(self, path: Path) -> None:
+            try:
+                fh = path.open("rb")
+            except OSError:
+                self._send_text(404, "Log not found")
+                return
+            with fh:
+                size = os.fstat(fh.fileno()).st_size
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; charset=utf-8")
+                self.send_header("Content-Length", str(size))
+                self.send_header("Access-Control-Allow-Origin", "*")
+                self.end_headers()
+                self.wfile.flush()
+                try:
+                    self.connection.sendfile(fh)
+                except (AttributeError, OSError):
+                    shutil.copyfileobj(fh, self.wfile, 64 * 1024)
+
         def _auth_ok(self) -> bool:
             if not _is_local_origin(self.headers.get("Origin")):
                 return False
@@ -496,12 +652,16 @@ def make_handler(server: ControlServer):
                 return
             if parsed.path.startswith("/logs/"):
                 filename = parsed.path.split("/logs/")[-1]
-                log_dir = Path(server.cfg.log_dir).expanduser()
-                target = (log_dir / filename).resolve()
-                if not target.exists() or log_dir.resolve() not in target.parents:
+                target = (server.log_root / filename).resolve()
+                try:
+                    target.relative_to(server.log_root)
+                except ValueError:
+                    self._send_text(404, "Log not found")
+                    return
+                if not target.is_file():
                     self._send_text(404, "Log not found")
                     return
-                self._send_text(200, target.read_text(encoding="utf-8", errors="replace"))
+                self._send_file(target)
                 return
             self._send_text(200, "AI_first control server running.")
 
@@ -515,13 +675,15 @@ def make_handler(server: ControlServer):
                     server.error_log.clear()
                 self._send_json(200, {"status": "cleared"})
                 return
-            length = int(self.headers.get("Content-Length", "0"))
-            raw = self.rfile.read(length) if length else b"{}"
-            try:
-                payload = json.loads(raw.decode("utf-8"))
-            except Exception:
-                self._send_json(400, {"error": "invalid json"})
-                return
+            length = int(self.headers.get("Content-Length") or 0)
+            if length:
+                try:
+                    payload = json_loads(self.rfile.read(length))
+                except Exception:
+                    self._send_json(400, {"error": "invalid json"})
+                    return
+            else:
+                payload = {}
             if parsed.path == "/api/run":
                 action = payload.get("action")
                 if action not in server.actions:
@@ -535,11 +697,11 @@ def make_handler(server: ControlServer):
                 self._send_json(200, asdict(job))
                 return
             if parsed.path == "/api/quick-issues":
-                data = _read_json(QUICK_ISSUES_PATH, _default_quick_issues())
+                now_date, now_stamp = _now_pair()
+                data = _read_json(QUICK_ISSUES_PATH, _default_quick_issues(now_date))
                 issues = data.get("issues") or []
+                by_id = {str(issue.get("id")): issue for issue in issues}
                 action = (payload.get("action") or "").strip().lower()
-                now_date = time.strftime("%Y-%m-%d")
-                now_stamp = _now()
                 if not action:
                     action = "update" if payload.get("id") else "create"
                 if action == "create":
@@ -547,7 +709,7 @@ def make_handler(server: ControlServer):
                     if not title:
                         self._send_json(400, {"error": "title required"})
                         return
-                    issue_id = _next_issue_id(issues, now_date)
+                    issue_id = _next_issue_id(data, now_date)
                     issue = {
                         "id": issue_id,
                         "title": title,
@@ -562,12 +724,13 @@ def make_handler(server: ControlServer):
                     if isinstance(issue["tags"], str):
                         issue["tags"] = [t.strip() for t in issue["tags"].split(",") if t.strip()]
                     issues.append(issue)
+                    by_id[issue_id] = issue
                 elif action in {"update", "close"}:
                     issue_id = (payload.get("id") or "").strip()
                     if not issue_id:
                         self._send_json(400, {"error": "id required"})
                         return
-                    target = next((i for i in issues if str(i.get("id")) == issue_id), None)
+                    target = by_id.get(issue_id)
                     if not target:
                         self._send_json(404, {"error": "issue not found"})
                         return
@@ -598,8 +761,8 @@ def make_handler(server: ControlServer):
                 self._send_json(200, data)
                 return
             if parsed.path == "/api/simple-project":
-                data = _read_json(SIMPLE_PROJECT_PATH, _default_simple_project())
                 now_date = time.strftime("%Y-%m-%d")
+                data = _read_json(SIMPLE_PROJECT_PATH, _default_simple_project(now_date))
                 if "title" in payload:
                     data["title"] = (payload.get("title") or "Untitled project").strip()
                 if "summary" in payload:
@@ -616,8 +779,8 @@ def make_handler(server: ControlServer):
                 self._send_json(200, data)
                 return
             if parsed.path == "/api/ui-style":
-                data = _read_json(UI_STYLE_SELECTION_PATH, _default_ui_style_selection())
                 now_date = time.strftime("%Y-%m-%d")
+                data = _read_json(UI_STYLE_SELECTION_PATH, _default_ui_style_selection(now_date))
                 if "active_template_id" in payload:
                     data["active_template_id"] = (payload.get("active_template_id") or "").strip()
                 if "notes" in payload:
@@ -652,6 +815,26 @@ def make_handler(server: ControlServer):
     return Handler
 
 
+class PooledHTTPServer(ThreadingHTTPServer):
+    """ThreadingHTTPServer variant that serves requests from a bounded worker pool.
+
+    The stock server spawns a fresh thread per connection; with a polling UI
+    that means constant thread creation and teardown. A small persistent pool
+    keeps concurrency while removing the per-request thread cost.
+    """
+
+    def __init__(self, *args: Any, max_workers: int = 8, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._pool = ThreadPoolExecutor(max_workers=max_workers)
+
+    def process_request(self, request: Any, client_address: Any) -> None:
+        self._pool.submit(self.process_request_thread, request, client_address)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self._pool.shutdown(wait=False)
+
+
 def main() -> int:
     cfg = parse_args()
     python_bin = cfg.python or sys.executable
@@ -660,7 +843,7 @@ def main() -> int:
     cfg.python = python_bin
     server = ControlServer(cfg)
     handler = make_handler(server)
-    httpd = ThreadingHTTPServer((cfg.host, cfg.port), handler)
+    httpd = PooledHTTPServer((cfg.host, cfg.port), handler)
     print(f"AI_first control server listening on http://{cfg.host}:{cfg.port}")
     if cfg.token:
         print("Token required (X-AI-Token).")
@@ -13,7 +13,7 @@ import re
 import subprocess
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 SEVERITY_ORDER = ["critical", "major", "minor", "nit"]
 STATUS_ORDER = ["open", "in_progress", "closed"]
@@ -215,7 +215,7 @@ class Paths:
     html_out: Path
 
 
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Local issue tracker helper (template)")
     parser.add_argument("command", choices=["list"], help="Command to run")
     parser.add_argument(
@@ -226,11 +226,11 @@ def parse_args() -> argparse.Namespace:
     )
     parser.add_argument("--format", choices=["json", "html"], default="json", help="Output format")
     parser.add_argument("--output", type=Path, default=None, help="Output file path")
-    return parser.parse_args()
+    return parser.parse_args(argv)
 
 
-def main() -> None:
-    args = parse_args()
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
     rows = _load_issues(args.data)
     _validate_issue_ids(rows)
     _apply_owner_defaults(rows)
@@ -251,5 +251,11 @@ def main() -> None:
     out_path.write_text(content, encoding="utf-8")
 
 
+def run(argv: List[str]) -> int:
+    """Entry point for in-process callers (e.g. the control server's worker pool)."""
+    main(argv)
+    return 0
+
+
 if __name__ == "__main__":
     main()
@@ -4,7 +4,7 @@ from __future__ import annotations
 import argparse
 from pathlib import Path
 
-from reintegration_lib import run_reintegration
+from reintegration_lib import HASH_ALGOS, run_reintegration
 
 
 def parse_args() -> argparse.Namespace:
@@ -25,6 +25,17 @@ def parse_args() -> argparse.Namespace:
         default="AI_first/reintegration/last_reintegration.md",
         help="Markdown summary output path.",
     )
+    p.add_argument(
+        "--keep-scratch",
+        action="store_true",
+        help="Materialize the scratch copy instead of hashing the source in place.",
+    )
+    p.add_argument(
+        "--hash-algo",
+        choices=HASH_ALGOS,
+        default="sha256",
+        help="Content fingerprint algorithm (falls back to sha256 if unavailable).",
+    )
     return p.parse_args()
 
 
@@ -37,10 +48,13 @@ def main() -> int:
         scratch_root=root / args.scratch_root,
         report_path=root / args.report,
         markdown_path=root / args.markdown,
+        keep_scratch=args.keep_scratch,
+        hash_algo=args.hash_algo,
     )
     print("Reintegration summary:")
     print(f"Source: {summary['source_ai_first']}")
-    print(f"Scratch copy: {summary['scratch_copy']}")
+    if summary["scratch_copy"]:
+        print(f"Scratch copy: {summary['scratch_copy']}")
     print(f"Added: {summary['counts']['added']}")
     print(f"Removed: {summary['counts']['removed']}")
     print(f"Changed: {summary['counts']['changed']}")
@@ -3,16 +3,39 @@ from __future__ import annotations
 
 import hashlib
 import json
+import mmap
+import os
 import shutil
 import subprocess
 import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Tuple
 
+from _jsonutil import json_dumps, json_loads
+from _jsonutil import orjson as _jsonutil_orjson
 
-IGNORED_DIRS = {".git", ".venv", "node_modules", "__pycache__"}
-IGNORED_FILES = {".DS_Store"}
+try:
+    import pygit2
+except ImportError:  # pragma: no cover - depends on local environment
+    pygit2 = None
+
+try:
+    import blake3
+except ImportError:  # pragma: no cover - depends on local environment
+    blake3 = None
+
+try:
+    import xxhash
+except ImportError:  # pragma: no cover - depends on local environment
+    xxhash = None
+
+
+IGNORED_DIRS = frozenset({".git", ".venv", "node_modules", "__pycache__"})
+IGNORED_FILES = frozenset({".DS_Store"})
+_IGNORED_ALL = IGNORED_DIRS | IGNORED_FILES
 
 
 @dataclass(frozen=True)
@@ -23,56 +46,273 @@ class ReintegrationPaths:
     scratch_copy: Path
 
 
-def _now_stamp() -> str:
-    return time.strftime("%Y-%m-%dT%H:%M:%S")
-
-
-def _date_stamp() -> str:
-    return time.strftime("%Y-%m-%d")
-
-
-def _timestamp_slug() -> str:
-    return time.strftime("%Y%m%d_%H%M%S")
-
-
-def _hash_file(path: Path) -> str:
-    h = hashlib.sha256()
-    with path.open("rb") as fh:
+def _now_strings() -> Tuple[str, str, str]:
+    """(timestamp, date, slug) rendered from a single localtime() call,
+    so every stamp in one run refers to the same instant."""
+    now = time.localtime()
+    return (
+        time.strftime("%Y-%m-%dT%H:%M:%S", now),
+        time.strftime("%Y-%m-%d", now),
+        time.strftime("%Y%m%d_%H%M%S", now),
+    )
+
+
+_MMAP_LIMIT = 4 * 1024 * 1024
+HASH_ALGOS = ("sha256", "blake3", "xxh3")
+
+
+def _new_digest(algo: str):
+    if algo == "blake3":
+        return blake3.blake3()
+    if algo == "xxh3":
+        return xxhash.xxh3_128()
+    return hashlib.sha256()
+
+
+def resolve_hash_algo(algo: str) -> str:
+    """Return algo if its backing module is importable, else "sha256"."""
+    if algo == "blake3" and blake3 is None:
+        return "sha256"
+    if algo == "xxh3" and xxhash is None:
+        return "sha256"
+    return algo
+
+
+_EMPTY_DIGESTS: Dict[str, str] = {}
+
+
+def _empty_digest(algo: str) -> str:
+    digest = _EMPTY_DIGESTS.get(algo)
+    if digest is None:
+        digest = _EMPTY_DIGESTS[algo] = _new_digest(algo).hexdigest()
+    return digest
+
+
+def _hash_file(path: str, algo: str = "sha256") -> str:
+    with open(path, "rb", buffering=0) as fh:
+        size = os.fstat(fh.fileno()).st_size
+        if size == 0:
+            return _empty_digest(algo)
+        if size <= _MMAP_LIMIT:
+            # Single map + one C-level digest pass beats the read() loop for
+            # the small files that dominate source trees.
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                h = _new_digest(algo)
+                h.update(mm)
+                return h.hexdigest()
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            # C-level readinto loop straight into the digest; no per-chunk bytecode.
+            return hashlib.file_digest(fh, lambda: _new_digest(algo)).hexdigest()
+        h = _new_digest(algo)
         for chunk in iter(lambda: fh.read(1024 * 1024), b""):
             h.update(chunk)
-    return h.hexdigest()
-
-
-def _iter_files(root: Path) -> Iterable[Path]:
-    for path in root.rglob("*"):
-        if path.is_dir():
-            if path.name in IGNORED_DIRS:
-                continue
-        if path.is_file():
-            if path.name in IGNORED_FILES:
-                continue
-            yield path
-
-
-def _build_manifest(root: Path) -> Dict[str, str]:
+        return h.hexdigest()
+
+
+def _iter_files(root: Path) -> Iterable[Tuple[str, os.stat_result]]:
+    # os.scandir reuses the stat information from the directory read, where
+    # Path.rglob allocates a Path plus extra stat calls per entry. The stat
+    # result rides along so callers never re-stat the path.
+    stack = [str(root)]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in IGNORED_DIRS:
+                        stack.append(entry.path)
+                elif entry.is_file() and entry.name not in IGNORED_FILES:
+                    yield entry.path, entry.stat()
+
+
+class _HashCache:
+    """Persistent (path, size, mtime_ns) -> digest cache so unchanged files skip hashing.
+
+    Only entries touched during the current run are written back, which keeps
+    the cache bounded by the size of the trees being compared.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        try:
+            self._old: Dict[str, str] = json_loads(path.read_bytes())
+        except Exception:
+            self._old = {}
+        self._live: Dict[str, str] = {}
+
+    @staticmethod
+    def key(path: str, st: os.stat_result, algo: str = "sha256") -> str:
+        return f"{algo}|{path}|{st.st_size}|{st.st_mtime_ns}"
+
+    def get(self, key: str) -> Optional[str]:
+        digest = self._old.get(key)
+        if digest is not None:
+            self._live[key] = digest
+        return digest
+
+    def store(self, key: str, digest: str) -> None:
+        self._live[key] = digest
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_bytes(json_dumps(self._live))
+        tmp.replace(self.path)
+
+
+def _hash_many(paths: List[str], algo: str = "sha256") -> List[str]:
+    """Bulk-hash kernel: digest many files with the per-byte work in C.
+
+    hashlib drops the GIL while OpenSSL runs, so a thread pool gets real
+    parallelism across files without a compiled extension; chunked map keeps
+    the per-file scheduling overhead off the interpreter loop.
+    """
+    if len(paths) < 2:
+        return [_hash_file(path, algo) for path in paths]
+    workers = min(32, (os.cpu_count() or 4) + 4)
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        return list(ex.map(lambda p: _hash_file(p, algo), paths, chunksize=32))
+
+
+def _hash_entries(
+    entries: List[Tuple[str, str]],
+    cache: Optional[_HashCache] = None,
+    algo: str = "sha256",
+) -> Dict[str, str]:
     manifest: Dict[str, str] = {}
-    for file_path in _iter_files(root):
-        rel = file_path.relative_to(root).as_posix()
-        manifest[rel] = _hash_file(file_path)
+    misses: List[Tuple[str, str, str]] = []
+    for rel, path in entries:
+        if cache is None:
+            misses.append((rel, "", path))
+            continue
+        key = _HashCache.key(path, os.stat(path), algo)
+        digest = cache.get(key)
+        if digest is not None:
+            manifest[rel] = digest
+        else:
+            misses.append((rel, key, path))
+    digests = _hash_many([path for _, _, path in misses], algo)
+    for (rel, key, _), digest in zip(misses, digests):
+        manifest[rel] = digest
+        if cache is not None:
+            cache.store(key, digest)
     return manifest
 
 
+@dataclass
+class ManifestSoA:
+    """Parallel arrays from a single walk: rels[i] has sizes[i] bytes,
+    mtime mtimes[i] (ns) and content digest digests[i]."""
+
+    rels: List[str]
+    sizes: array
+    mtimes: array
+    digests: List[str]
+
+    def as_dict(self) -> Dict[str, str]:
+        return dict(zip(self.rels, self.digests))
+
+
+def _walk_and_hash(
+    root: Path, cache: Optional[_HashCache] = None, algo: str = "sha256"
+) -> ManifestSoA:
+    """Walk, stat and hash in one pass instead of three traversals per file.
+
+    The scandir stat feeds the size/mtime columns and the cache key directly,
+    so no path is stat'ed more than once before hashing.
+    """
+    start = len(str(root)) + 1
+    rels: List[str] = []
+    sizes = array("q")
+    mtimes = array("q")
+    digests: List[str] = []
+    miss_indices: List[int] = []
+    miss_keys: List[str] = []
+    miss_paths: List[str] = []
+    for path, st in _iter_files(root):
+        rels.append(path[start:].replace(os.sep, "/"))
+        sizes.append(st.st_size)
+        mtimes.append(st.st_mtime_ns)
+        digest = None
+        key = ""
+        if cache is not None:
+            key = _HashCache.key(path, st, algo)
+            digest = cache.get(key)
+        if digest is None:
+            miss_indices.append(len(digests))
+            miss_keys.append(key)
+            miss_paths.append(path)
+            digests.append("")
+        else:
+            digests.append(digest)
+    for idx, key, digest in zip(miss_indices, miss_keys, _hash_many(miss_paths, algo)):
+        digests[idx] = digest
+        if cache is not None:
+            cache.store(key, digest)
+    return ManifestSoA(rels, sizes, mtimes, digests)
+
+
+def _build_manifest(
+    root: Path, cache: Optional[_HashCache] = None, algo: str = "sha256"
+) -> Dict[str, str]:
+    return _walk_and_hash(root, cache, algo).as_dict()
+
+
+def _build_tracked_manifest(
+    source_root: Path,
+    src: Path,
+    tracked: List[Path],
+    cache: Optional[_HashCache] = None,
+    algo: str = "sha256",
+) -> Dict[str, str]:
+    """Hash the source tree in place, limited to git-tracked files."""
+    src_rel = src.relative_to(source_root)
+    entries: List[Tuple[str, Path]] = []
+    for rel_path in tracked:
+        if _IGNORED_ALL.intersection(rel_path.parts):
+            continue
+        src_path = source_root / rel_path
+        if not src_path.is_file():
+            continue
+        entries.append((rel_path.relative_to(src_rel).as_posix(), str(src_path)))
+    return _hash_entries(entries, cache, algo)
+
+
+def _manifest_root_hash(manifest: Dict[str, str]) -> str:
+    """Merkle-style root over the sorted (rel, digest) pairs.
+
+    Equal roots mean identical trees, letting callers skip the full diff.
+    """
+    h = hashlib.sha256()
+    for rel, digest in sorted(manifest.items()):
+        h.update(f"{rel}:{digest}\n".encode())
+    return h.hexdigest()
+
+
 def _diff_manifests(
     current: Dict[str, str], incoming: Dict[str, str]
-) -> Tuple[List[str], List[str], List[str], List[str]]:
-    current_keys = set(current.keys())
-    incoming_keys = set(incoming.keys())
+) -> Tuple[List[str], List[str], List[str], int]:
+    # dict views support set operations directly; no materialized set copies.
+    # Unchanged paths are only ever counted, so they are never collected or
+    # sorted -- that sort was the largest one on a mostly-identical tree.
+    current_keys = current.keys()
+    incoming_keys = incoming.keys()
     added = sorted(incoming_keys - current_keys)
     removed = sorted(current_keys - incoming_keys)
-    common = current_keys & incoming_keys
-    changed = sorted([k for k in common if current[k] != incoming[k]])
-    same = sorted([k for k in common if current[k] == incoming[k]])
-    return added, removed, changed, same
+    changed: List[str] = []
+    for key, digest in current.items():
+        other = incoming.get(key)
+        if other is not None and other != digest:
+            changed.append(key)
+    changed.sort()
+    # Everything common and not changed is "same"; deriving the count
+    # arithmetically keeps the loop free of any per-entry work for the
+    # (dominant) unchanged case.
+    same_count = len(current) - len(removed) - len(changed)
+    return added, removed, changed, same_count
 
 
 def _find_ai_first_dir(source_path: Path) -> Tuple[Path, Path]:
@@ -87,47 +327,198 @@ def _find_ai_first_dir(source_path: Path) -> Tuple[Path, Path]:
 def _git_tracked_files(root: Path, rel_dir: Path) -> Optional[List[Path]]:
     if not (root / ".git").exists():
         return None
+    if pygit2 is not None:
+        # libgit2 reads the packed index in-process, skipping the fork+exec
+        # and stdout parsing the subprocess path pays.
+        try:
+            repo = pygit2.Repository(str(root))
+            prefix = rel_dir.as_posix().rstrip("/") + "/"
+            return [
+                Path(entry.path)
+                for entry in repo.index
+                if entry.path.startswith(prefix)
+            ]
+        except Exception:
+            pass
+    # Bytes end to end: the output is split on NUL either way, so the
+    # upfront UTF-8 decode of the whole listing is skipped and each entry
+    # goes through os.fsdecode only once.
     try:
-        result = subprocess.run(
+        proc = subprocess.Popen(
             ["git", "-C", str(root), "ls-files", "-z", "--", str(rel_dir)],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        out, _ = proc.communicate()
+    except OSError:
+        return None
+    if proc.returncode != 0:
+        return None
+    return [Path(os.fsdecode(p)) for p in out.split(b"\0") if p]
+
+
+def _git_worktree_clean(root: Path, rel_dir: Path) -> bool:
+    if not (root / ".git").exists():
+        return False
+    try:
+        result = subprocess.run(
+            ["git", "-C", str(root), "status", "--porcelain", "--", str(rel_dir)],
             check=True,
             capture_output=True,
             text=True,
         )
     except Exception:
+        return False
+    return not result.stdout.strip()
+
+
+def _git_tree_manifest(root: Path, rel_dir: Path) -> Optional[Dict[str, str]]:
+    """Map rel path -> git blob SHA-1 for rel_dir at HEAD, or None when unavailable.
+
+    The IDs come straight from the object database, so no file contents are
+    read. Only meaningful when the working tree is clean for rel_dir; callers
+    must pair this with _git_worktree_clean.
+    """
+    if not (root / ".git").exists():
         return None
-    if not result.stdout:
-        return []
-    paths = [Path(p) for p in result.stdout.split("\0") if p]
-    return paths
+    try:
+        result = subprocess.run(
+            ["git", "-C", str(root), "ls-tree", "-r", "-z", "HEAD", "--", str(rel_dir)],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+    except Exception:
+        return None
+    prefix = rel_dir.as_posix().rstrip("/") + "/"
+    manifest: Dict[str, str] = {}
+    for entry in result.stdout.split("\0"):
+        if not entry:
+            continue
+        meta, _, path = entry.partition("\t")
+        rel = path[len(prefix):] if path.startswith(prefix) else path
+        if _IGNORED_ALL.intersection(rel.split("/")):
+            continue
+        manifest[rel] = meta.split()[2]
+    return manifest
 
 
-def _copy_ai_first(src: Path, dest: Path, *, tracked: Optional[List[Path]] = None) -> str:
+def _copy_and_hash(src_path: Path, target: Path, algo: str = "sha256") -> str:
+    """Copy src_path to target while feeding the bytes through the digest.
+
+    One read pass serves both the copy and the manifest digest, instead of
+    copying first and re-reading the scratch tree to hash it.
+    """
+    h = _new_digest(algo)
+    with src_path.open("rb") as src_fh, target.open("wb") as dst_fh:
+        while True:
+            buf = src_fh.read(1024 * 1024)
+            if not buf:
+                break
+            h.update(buf)
+            dst_fh.write(buf)
+    shutil.copystat(src_path, target)
+    return h.hexdigest()
+
+
+def _copy_file_contents(src_path: str, dst_path: str) -> None:
+    """Copy file bytes, in-kernel via os.copy_file_range where supported."""
+    if not hasattr(os, "copy_file_range"):
+        shutil.copyfile(src_path, dst_path)
+        return
+    with open(src_path, "rb") as sf, open(dst_path, "wb") as df:
+        sfd = sf.fileno()
+        dfd = df.fileno()
+        remaining = os.fstat(sfd).st_size
+        try:
+            while remaining > 0:
+                copied = os.copy_file_range(sfd, dfd, remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+        except OSError:
+            # e.g. cross-filesystem on older kernels; finish in userspace.
+            pass
+        if remaining:
+            shutil.copyfileobj(sf, df, 1024 * 1024)
+
+
+def _copy_one(src_path: str, dst_path: str, algo: str) -> str:
+    _copy_file_contents(src_path, dst_path)
+    shutil.copystat(src_path, dst_path)
+    return _hash_file(dst_path, algo)
+
+
+def _parallel_copytree(src: Path, dest: Path, algo: str = "sha256") -> Dict[str, str]:
+    """Copy src to dest with per-file tasks on a thread pool.
+
+    Directories are created up front during a single-threaded walk; the
+    file copies are I/O bound and fan out across the pool, each landing the
+    bytes in-kernel and hashing the fresh (page-cache hot) destination.
+    """
+    start = len(str(src)) + 1
+    tasks: List[Tuple[str, str, str]] = []
+    dir_pairs: List[Tuple[str, str]] = []
+    stack = [str(src)]
+    while stack:
+        src_dir = stack.pop()
+        dst_dir = os.path.join(str(dest), src_dir[start:]) if src_dir[start:] else str(dest)
+        os.makedirs(dst_dir, exist_ok=True)
+        dir_pairs.append((src_dir, dst_dir))
+        with os.scandir(src_dir) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in IGNORED_DIRS:
+                        stack.append(entry.path)
+                elif entry.is_file() and entry.name not in IGNORED_FILES:
+                    tasks.append(
+                        (entry.path[start:], entry.path, os.path.join(dst_dir, entry.name))
+                    )
+    workers = min(32, (os.cpu_count() or 4) * 4)
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        digests = list(
+            ex.map(lambda t: _copy_one(t[1], t[2], algo), tasks, chunksize=16)
+        )
+    for src_dir, dst_dir in dir_pairs:
+        shutil.copystat(src_dir, dst_dir)
+    return {
+        rel.replace(os.sep, "/"): digest
+        for (rel, _, _), digest in zip(tasks, digests)
+    }
+
+
+def _copy_ai_first(
+    src: Path,
+    dest: Path,
+    *,
+    tracked: Optional[List[Path]] = None,
+    algo: str = "sha256",
+) -> Tuple[str, Dict[str, str]]:
+    manifest: Dict[str, str] = {}
     if tracked is not None:
-        dest.mkdir(parents=True, exist_ok=True)
+        src_rel = src.relative_to(src.parent)
+        pairs: List[Tuple[str, Path, Path]] = []
+        parents = {dest}
         for rel_path in tracked:
-            if rel_path.name in IGNORED_FILES:
+            if _IGNORED_ALL.intersection(rel_path.parts):
                 continue
-            if any(part in IGNORED_DIRS for part in rel_path.parts):
+            rel = rel_path.relative_to(src_rel)
+            target = dest / rel
+            pairs.append((rel.as_posix(), src.parent / rel_path, target))
+            parents.add(target.parent)
+        for parent in parents:
+            parent.mkdir(parents=True, exist_ok=True)
+        for rel, src_path, target in pairs:
+            # git-tracked paths exist unless the worktree is corrupt, so a
+            # stat per file just to confirm is wasted work; the rare miss
+            # (or a submodule directory) surfaces at open time instead.
+            try:
+                manifest[rel] = _copy_and_hash(src_path, target, algo)
+            except (FileNotFoundError, IsADirectoryError):
                 continue
-            src_path = src.parent / rel_path
-            if not src_path.exists():
-                continue
-            target = dest / rel_path.relative_to(src.relative_to(src.parent))
-            target.parent.mkdir(parents=True, exist_ok=True)
-            if src_path.is_file():
-                shutil.copy2(src_path, target)
-        return "tracked"
-
-    def _ignore(path: str, names: List[str]) -> List[str]:
-        ignored: List[str] = []
-        for name in names:
-            if name in IGNORED_DIRS or name in IGNORED_FILES:
-                ignored.append(name)
-        return ignored
+        return "tracked", manifest
 
-    shutil.copytree(src, dest, ignore=_ignore)
-    return "full"
+    return "full", _parallel_copytree(src, dest, algo)
 
 
 def run_reintegration(
@@ -137,36 +528,90 @@ def run_reintegration(
     scratch_root: Path,
     report_path: Optional[Path] = None,
     markdown_path: Optional[Path] = None,
+    keep_scratch: bool = False,
+    hash_algo: str = "sha256",
 ) -> Dict[str, object]:
+    timestamp, date, slug = _now_strings()
+    requested_algo = hash_algo
+    content_algo = resolve_hash_algo(hash_algo)
     source_root, source_ai_first = _find_ai_first_dir(Path(source_path).expanduser())
     scratch_root.mkdir(parents=True, exist_ok=True)
-    scratch_copy = scratch_root / f"ai_first_{_timestamp_slug()}"
     rel_ai_first = source_ai_first.relative_to(source_root)
     tracked = _git_tracked_files(source_root, rel_ai_first)
-    copy_mode = _copy_ai_first(source_ai_first, scratch_copy, tracked=tracked)
+    # Hashing is read-only, so the diff does not need a materialized snapshot;
+    # only keep_scratch callers pay the full-tree write bandwidth.
+    scratch_copy: Optional[Path] = None
+    copy_mode = "none"
+    copied_manifest: Optional[Dict[str, str]] = None
+    if keep_scratch:
+        scratch_copy = scratch_root / f"ai_first_{slug}"
+        copy_mode, copied_manifest = _copy_ai_first(
+            source_ai_first, scratch_copy, tracked=tracked, algo=content_algo
+        )
 
-    incoming_manifest = _build_manifest(scratch_copy)
-    current_manifest = _build_manifest(current_ai_first)
-    added, removed, changed, same = _diff_manifests(current_manifest, incoming_manifest)
+    # Fast path: when both trees are clean git checkouts, compare the blob IDs
+    # git already stores instead of re-reading file contents.
+    hash_algo = content_algo
+    incoming_manifest: Optional[Dict[str, str]] = None
+    current_manifest: Optional[Dict[str, str]] = None
+    if tracked is not None and _git_worktree_clean(source_root, rel_ai_first):
+        incoming_git = _git_tree_manifest(source_root, rel_ai_first)
+        current_root = current_ai_first.parent
+        current_rel = Path(current_ai_first.name)
+        if incoming_git is not None and _git_worktree_clean(current_root, current_rel):
+            current_git = _git_tree_manifest(current_root, current_rel)
+            if current_git is not None:
+                incoming_manifest = incoming_git
+                current_manifest = current_git
+                hash_algo = "git-sha1"
+    if incoming_manifest is None or current_manifest is None:
+        cache = _HashCache(scratch_root / ".hash_cache.json")
+        if copied_manifest is not None:
+            # The copy already hashed the incoming tree in the same pass.
+            incoming_manifest = copied_manifest
+        elif tracked is not None:
+            incoming_manifest = _build_tracked_manifest(
+                source_root, source_ai_first, tracked, cache, content_algo
+            )
+        else:
+            incoming_manifest = _build_manifest(source_ai_first, cache, content_algo)
+        current_manifest = _build_manifest(current_ai_first, cache, content_algo)
+        cache.save()
+    current_root_hash = _manifest_root_hash(current_manifest)
+    incoming_root_hash = _manifest_root_hash(incoming_manifest)
+    if current_root_hash == incoming_root_hash:
+        # Identical trees: nothing to classify, skip the diff entirely.
+        added, removed, changed = [], [], []
+        same_count = len(current_manifest)
+    else:
+        added, removed, changed, same_count = _diff_manifests(
+            current_manifest, incoming_manifest
+        )
 
     warnings: List[str] = []
+    if content_algo != requested_algo:
+        warnings.append(
+            f"Hash algorithm '{requested_algo}' is unavailable; fell back to sha256."
+        )
     if tracked is None:
         warnings.append("Source repo is not a git repository; .gitignore rules not applied.")
 
     summary = {
-        "timestamp": _now_stamp(),
-        "date": _date_stamp(),
+        "timestamp": timestamp,
+        "date": date,
         "source_root": str(source_root),
         "source_ai_first": str(source_ai_first),
-        "scratch_copy": str(scratch_copy),
+        "scratch_copy": str(scratch_copy) if scratch_copy is not None else "",
         "copy_mode": copy_mode,
+        "hash_algo": hash_algo,
+        "root_hash": {"current": current_root_hash, "incoming": incoming_root_hash},
         "tracked_count": len(tracked) if tracked is not None else None,
         "warnings": warnings,
         "counts": {
             "added": len(added),
             "removed": len(removed),
             "changed": len(changed),
-            "same": len(same),
+            "same": same_count,
             "total_current": len(current_manifest),
             "total_incoming": len(incoming_manifest),
         },
@@ -177,7 +622,14 @@ def run_reintegration(
 
     if report_path:
         report_path.parent.mkdir(parents=True, exist_ok=True)
-        report_path.write_text(json.dumps(summary, indent=2, sort_keys=True), encoding="utf-8")
+        if _jsonutil_orjson is not None:
+            # One UTF-8 buffer from the C serializer, written as-is.
+            report_path.write_bytes(json_dumps(summary, indent2=True, sort_keys=True))
+        else:
+            # Stream straight to the file instead of materializing the
+            # pretty-printed string and re-encoding it via write_text.
+            with report_path.open("w", encoding="utf-8") as fh:
+                json.dump(summary, fh, indent=2, sort_keys=True)
     if markdown_path:
         markdown_path.parent.mkdir(parents=True, exist_ok=True)
         markdown_path.write_text(_render_markdown(summary), encoding="utf-8")
@@ -7,7 +7,7 @@ import html
 import os
 import re
 from pathlib import Path
-from typing import Iterable, List
+from typing import Iterable, List, Optional
 
 
 TABLE_SEPARATOR = re.compile(r"^\s*\|?\s*:?[-]+:?\s*(\|\s*:?[-]+:?\s*)+\|?\s*$")
@@ -184,12 +184,12 @@ def _iter_md_files(root: Path) -> Iterable[Path]:
     return root.rglob("*.md")
 
 
-def main() -> None:
+def main(argv: Optional[List[str]] = None) -> None:
     parser = argparse.ArgumentParser(description="Render support and project markdown files into static HTML")
     parser.add_argument("--support", type=Path, default=Path("AI_first/docs"), help="Support docs root")
     parser.add_argument("--projects", type=Path, default=Path("AI_first/projects"), help="Projects root")
     parser.add_argument("--out", type=Path, default=Path("AI_first/ui/docs"), help="Output HTML root")
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     repo_root = Path(__file__).resolve().parents[2]
     support_root = (repo_root / args.support).resolve()
@@ -211,5 +211,11 @@ def main() -> None:
             _build_doc(md_path, out_path, repo_root)
 
 
+def run(argv: List[str]) -> int:
+    """Entry point for in-process callers (e.g. the control server's worker pool)."""
+    main(argv)
+    return 0
+
+
 if __name__ == "__main__":
     main()
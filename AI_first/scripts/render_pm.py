@@ -544,7 +544,7 @@ def _update_project_detail(
     return True
 
 
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Render PM dashboards from project docs")
     parser.add_argument(
         "--projectplan",
@@ -571,11 +571,11 @@ def parse_args() -> argparse.Namespace:
         help="UI root containing project_<project>.html",
     )
     parser.add_argument("--dry-run", action="store_true", help="Print actions without writing files")
-    return parser.parse_args()
+    return parser.parse_args(argv)
 
 
-def main() -> None:
-    args = parse_args()
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
     repo_root = Path(__file__).resolve().parents[2]
     projectplan_path = (repo_root / args.projectplan).resolve()
     issues_path = (repo_root / args.issues).resolve()
@@ -604,6 +604,12 @@ def main() -> None:
         print("No updates needed.")
 
 
+def run(argv: List[str]) -> int:
+    """Entry point for in-process callers (e.g. the control server's worker pool)."""
+    main(argv)
+    return 0
+
+
 if __name__ == "__main__":
     try:
         main()